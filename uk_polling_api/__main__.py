@@ -3,6 +3,7 @@
 Usage:
     python -m uk_polling_api
     python -m uk_polling_api --host 0.0.0.0 --port 8080
+    UK_POLLS_CACHE_DIR=/var/cache/uk_polls python -m uk_polling_api --workers 4
 """
 
 import argparse
@@ -24,6 +25,13 @@ def main():
     parser.add_argument(
         "--reload", action="store_true", help="Enable auto-reload for development"
     )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help=(
+            "Number of worker processes (default: 1). Set UK_POLLS_CACHE_DIR "
+            "so workers share one scraper"
+        ),
+    )
     args = parser.parse_args()
 
     logging.basicConfig(
@@ -36,6 +44,7 @@ def main():
         host=args.host,
         port=args.port,
         reload=args.reload,
+        workers=args.workers,
     )
 
 
@@ -4,21 +4,62 @@ A REST API that captures and serves the latest UK opinion polling data
 on Westminster voting intentions.
 """
 
+import hashlib
 import logging
+import os
+import pickle
+import re
+import tempfile
+import time
 from contextlib import asynccontextmanager
-from datetime import date
+from datetime import date, datetime, timedelta, timezone
 from typing import Optional
 
+import orjson
 from apscheduler.schedulers.background import BackgroundScheduler
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional speed-up
+    xxhash = None
 
 from .models import PartyTrend, PollResult, PollSummary, PollingDataStatus
-from .store import polling_store
+from .store import PollingStore, polling_store
+
+try:
+    from .seed_data import SEED_POLLS
+except ImportError:  # pragma: no cover - seed data is optional
+    SEED_POLLS = []
 
 logger = logging.getLogger(__name__)
 
 REFRESH_INTERVAL_HOURS = 6
+# Random offset per run so instances don't all hit Wikipedia in phase
+REFRESH_JITTER_SECONDS = 600
+
+# Directory for the on-disk copy of the last scrape; unset disables it
+CACHE_DIR_ENV = "UK_POLLS_CACHE_DIR"
+CACHE_FILENAME = "uk_polls.pkl"
+# A cache file stays fresh for a full refresh cycle, including the jitter
+# that can push the next scrape back, plus a margin for the scrape itself
+DISK_CACHE_MAX_AGE_SECONDS = (
+    REFRESH_INTERVAL_HOURS * 3600 + REFRESH_JITTER_SECONDS + 300
+)
+# Workers sharing the cache directory elect one scraper via this lock file;
+# the others poll the disk cache for its results
+REFRESH_LOCK_FILENAME = "refresh.lock"
+DISK_CACHE_POLL_MINUTES = 10
+# Non-scraping workers first check for the scraper's results this soon
+# after startup, rather than waiting a full poll interval
+DISK_CACHE_STARTUP_POLL_SECONDS = 30
 
 VALID_PARTIES = [
     "conservative", "labour", "liberal democrats", "lib_dem",
@@ -26,46 +67,259 @@ VALID_PARTIES = [
     "con", "lab",
 ]
 
+# Read-only paths whose JSON bodies are tagged for conditional GETs
+ETAG_PATH_PREFIXES = ("/polls", "/status")
+ETAG_CACHE_CONTROL = "max-age=300"
+ETAG_CACHE_MAX_ENTRIES = 1024
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response encoded with orjson.
+
+    Used by endpoints that return plain dicts. Those skip response-model
+    serialization and go straight to orjson, which also encodes dates
+    natively.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+def _cache_path() -> Optional[str]:
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    return os.path.join(cache_dir, CACHE_FILENAME) if cache_dir else None
+
 
-def refresh_polling_data() -> int:
-    """Fetch fresh polling data. Falls back to seed data on failure."""
+def _save_disk_cache(polls: list[PollResult]) -> None:
+    """Persist scraped polls so a restart can skip the next scrape."""
+    path = _cache_path()
+    if path is None:
+        return
+    tmp_path = None
+    try:
+        # Write then rename so readers never see a partial file. The temp
+        # name is unique per write, so concurrent writers can't interleave
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path),
+            prefix=f"{CACHE_FILENAME}.",
+            suffix=".tmp",
+        )
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(polls, f, protocol=5)
+        os.replace(tmp_path, path)
+    except OSError:
+        logger.exception("Failed to write polling cache to %s", path)
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def _touch_disk_cache() -> None:
+    """Mark the disk cache as confirmed current without rewriting it.
+
+    Called when the source page is unchanged, so workers starting later
+    still treat the existing file as fresh.
+    """
+    path = _cache_path()
+    if path is None:
+        return
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        logger.exception("Failed to update polling cache %s", path)
+
+
+# mtime of the disk cache file last loaded into the store
+_disk_cache_mtime: Optional[float] = None
+
+
+def _load_disk_cache(store: Optional[PollingStore] = None) -> int:
+    """Load polls from the disk cache if still fresh. Returns count loaded.
+
+    A file that has already been loaded is skipped, so polling it does not
+    needlessly invalidate the store's caches.
+    """
+    if store is None:
+        store = polling_store
+    global _disk_cache_mtime
+    path = _cache_path()
+    if path is None:
+        return 0
+    try:
+        mtime = os.stat(path).st_mtime
+        if (
+            mtime == _disk_cache_mtime
+            or time.time() - mtime >= DISK_CACHE_MAX_AGE_SECONDS
+        ):
+            return 0
+        with open(path, "rb") as f:
+            polls = pickle.load(f)
+    except FileNotFoundError:
+        return 0
+    except Exception:
+        logger.exception("Failed to read polling cache from %s", path)
+        return 0
+    _disk_cache_mtime = mtime
+    return store.load(polls, source="disk_cache")
+
+
+_refresh_lock_file = None
+
+
+def _acquire_refresh_lock() -> bool:
+    """Return True if this process should scrape on the refresh schedule.
+
+    Without a cache directory every process refreshes on its own. With one,
+    the first worker to take an exclusive lock on a file there becomes the
+    scraper and holds the lock until it shuts down.
+    """
+    global _refresh_lock_file
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if not cache_dir or fcntl is None or _refresh_lock_file is not None:
+        return True
+    lock_path = os.path.join(cache_dir, REFRESH_LOCK_FILENAME)
+    try:
+        lock_file = open(lock_path, "a")
+    except OSError:
+        logger.exception(
+            "Cannot open refresh lock %s; refreshing in this process",
+            lock_path,
+        )
+        return True
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+    _refresh_lock_file = lock_file
+    return True
+
+
+def _release_refresh_lock() -> None:
+    global _refresh_lock_file
+    if _refresh_lock_file is not None:
+        _refresh_lock_file.close()
+        _refresh_lock_file = None
+
+
+def refresh_polling_data(store: Optional[PollingStore] = None) -> int:
+    """Fetch fresh polling data into *store* (default: the shared store).
+
+    Falls back to seed data on failure. Returns the number of polls loaded,
+    or 0 if nothing was loaded (including when the source page is
+    unchanged).
+    """
+    if store is None:
+        store = polling_store
     try:
         from .scraper import scrape_polls
 
         polls = scrape_polls()
-        if polls:
-            return polling_store.load(polls, source="wikipedia")
+        if polls is None:
+            logger.info("Polling data unchanged; keeping current data")
+            _touch_disk_cache()
+        elif polls:
+            _save_disk_cache(polls)
+            return store.load(polls, source="wikipedia")
     except Exception:
         logger.exception("Failed to scrape live polling data")
 
     # Fall back to seed data if scraping fails or returns nothing
-    if polling_store.get_status().total_polls == 0:
-        logger.info("Loading seed data as fallback")
-        from .seed_data import SEED_POLLS
+    return _load_seed_fallback(store)
+
+
+def _load_seed_fallback(store: PollingStore) -> int:
+    """Load the seed data into *store* if it is empty. Returns count loaded.
 
-        return polling_store.load(SEED_POLLS, source="seed_data")
+    Only an empty store is seeded, so repeated failures never reload (and
+    invalidate the caches for) seed data that is already in place.
+    """
+    if SEED_POLLS and store.poll_count == 0:
+        logger.info("Loading seed data as fallback")
+        return store.load(SEED_POLLS, source="seed_data")
     return 0
 
 
+def _load_initial_data(store: PollingStore, is_scraper: bool) -> None:
+    """Fill *store* on startup, from the disk cache if it is fresh.
+
+    Otherwise only the scraping worker fetches from the source; the others
+    serve seed data until its results reach the disk cache.
+    """
+    if _load_disk_cache(store):
+        return
+    if is_scraper:
+        refresh_polling_data(store)
+    else:
+        _load_seed_fallback(store)
+
+
+def get_store() -> PollingStore:
+    """Dependency returning the store the endpoints read from.
+
+    Tests bind their own store with ``app.dependency_overrides[get_store]``.
+    """
+    return polling_store
+
+
+def _resolve_store(app: FastAPI) -> PollingStore:
+    """Return the store ``get_store`` resolves to, honouring overrides.
+
+    For code outside the request handlers (lifespan, middleware), which
+    FastAPI's dependency injection does not reach.
+    """
+    return app.dependency_overrides.get(get_store, get_store)()
+
+
 scheduler = BackgroundScheduler()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan: load data on startup, schedule refreshes."""
-    refresh_polling_data()
-    scheduler.add_job(
-        refresh_polling_data,
-        "interval",
-        hours=REFRESH_INTERVAL_HOURS,
-        id="refresh_polls",
-    )
+    store = _resolve_store(app)
+    is_scraper = _acquire_refresh_lock()
+    _load_initial_data(store, is_scraper)
+    if is_scraper:
+        scheduler.add_job(
+            refresh_polling_data,
+            "interval",
+            args=[store],
+            hours=REFRESH_INTERVAL_HOURS,
+            jitter=REFRESH_JITTER_SECONDS,
+            # Run missed ticks (e.g. after a suspend) once, never overlapping
+            coalesce=True,
+            max_instances=1,
+            misfire_grace_time=3600,
+            id="refresh_polls",
+            replace_existing=True,
+        )
+        logger.info(
+            "Scheduler started — refreshing every %d hours",
+            REFRESH_INTERVAL_HOURS,
+        )
+    else:
+        scheduler.add_job(
+            _load_disk_cache,
+            "interval",
+            args=[store],
+            minutes=DISK_CACHE_POLL_MINUTES,
+            next_run_time=datetime.now(timezone.utc)
+            + timedelta(seconds=DISK_CACHE_STARTUP_POLL_SECONDS),
+            coalesce=True,
+            max_instances=1,
+            id="reload_disk_cache",
+            replace_existing=True,
+        )
+        logger.info(
+            "Another worker is scraping — reloading the disk cache every "
+            "%d minutes", DISK_CACHE_POLL_MINUTES,
+        )
     scheduler.start()
-    logger.info(
-        "Scheduler started — refreshing every %d hours", REFRESH_INTERVAL_HOURS
-    )
     yield
     scheduler.shutdown(wait=False)
+    _release_refresh_lock()
 
 
 app = FastAPI(
@@ -81,6 +335,104 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+
+def _compute_etag(body: bytes) -> str:
+    """Return a quoted strong ETag for a response body."""
+    if xxhash is not None:
+        digest = xxhash.xxh64(body).hexdigest()
+    else:
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+# Entity tags in an If-None-Match list; the W/ weak prefix is dropped, as
+# If-None-Match uses weak comparison
+_ETAG_RE = re.compile(r'(?:W/)?("[^"]*")')
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Return True if an If-None-Match header value matches *etag*."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in _ETAG_RE.findall(if_none_match)
+
+
+def _not_modified_headers(headers) -> dict[str, str]:
+    """Headers of a 200 response that a 304 for it should repeat.
+
+    Everything but the content-describing fields, so Vary, CORS and the
+    like survive the revalidation.
+    """
+    return {
+        name: value for name, value in headers.items()
+        if not name.lower().startswith("content-")
+        and name.lower() != "transfer-encoding"
+    }
+
+
+# URL -> (store version, ETag) of the last 200 response served for it
+_etag_cache: dict[str, tuple[int, str]] = {}
+
+
+@app.middleware("http")
+async def etag_middleware(request: Request, call_next):
+    """Attach ETags to read endpoints and answer matching revalidations with 304.
+
+    The store only changes on refresh, so an ETag issued since the last
+    refresh is answered straight from ``_etag_cache`` without running the
+    endpoint again.
+    """
+    if (
+        request.method != "GET"
+        or not request.url.path.startswith(ETAG_PATH_PREFIXES)
+    ):
+        return await call_next(request)
+
+    key = str(request.url)
+    version = _resolve_store(request.app).version
+    if_none_match = request.headers.get("if-none-match")
+
+    cached = _etag_cache.get(key)
+    if (
+        cached is not None
+        and cached[0] == version
+        and _etag_matches(if_none_match, cached[1])
+    ):
+        return Response(
+            status_code=304,
+            headers={"ETag": cached[1], "Cache-Control": ETAG_CACHE_CONTROL},
+        )
+
+    response = await call_next(request)
+    if response.status_code != 200:
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    etag = _compute_etag(body)
+    if len(_etag_cache) >= ETAG_CACHE_MAX_ENTRIES:
+        _etag_cache.clear()
+    _etag_cache[key] = (version, etag)
+
+    headers = dict(response.headers)
+    headers["ETag"] = etag
+    headers["Cache-Control"] = ETAG_CACHE_CONTROL
+    if _etag_matches(if_none_match, etag):
+        return Response(
+            status_code=304, headers=_not_modified_headers(headers),
+        )
+
+    return Response(
+        content=body,
+        status_code=response.status_code,
+        headers=headers,
+        media_type=response.media_type,
+    )
+
+
+# Added last so it wraps the ETag middleware, whose 304 short-circuits
+# would otherwise go out without the CORS headers
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -120,9 +472,10 @@ def root():
 )
 def get_latest_polls(
     n: int = Query(default=10, ge=1, le=100, description="Number of polls"),
+    store: PollingStore = Depends(get_store),
 ):
     """Return the *n* most recent voting intention polls (default 10)."""
-    return polling_store.get_latest(n)
+    return store.cached_get_latest(n)
 
 
 @app.get(
@@ -131,9 +484,9 @@ def get_latest_polls(
     tags=["polls"],
     summary="Get all stored polls",
 )
-def get_all_polls():
+def get_all_polls(store: PollingStore = Depends(get_store)):
     """Return every poll currently stored, newest first."""
-    return polling_store.get_all()
+    return store.get_all()
 
 
 @app.get(
@@ -147,9 +500,10 @@ def get_summary(
         default=10, ge=1, le=50,
         description="Number of recent polls to average",
     ),
+    store: PollingStore = Depends(get_store),
 ):
     """Compute a weighted average of the last *n* polls."""
-    summary = polling_store.get_summary(n)
+    summary = store.cached_get_summary(n)
     if summary is None:
         raise HTTPException(status_code=404, detail="No polling data available")
     return summary
@@ -161,12 +515,12 @@ def get_summary(
     tags=["polls"],
     summary="Filter polls by pollster",
 )
-def get_by_pollster(name: str):
+def get_by_pollster(name: str, store: PollingStore = Depends(get_store)):
     """Return all polls conducted by the given polling organisation.
 
     Performs a case-insensitive partial match (e.g. 'yougov' matches 'YouGov').
     """
-    results = polling_store.get_by_pollster(name)
+    results = store.cached_get_by_pollster(name)
     if not results:
         raise HTTPException(
             status_code=404,
@@ -181,13 +535,13 @@ def get_by_pollster(name: str):
     tags=["polls"],
     summary="Get data points for a specific party",
 )
-def get_by_party(name: str):
+def get_by_party(name: str, store: PollingStore = Depends(get_store)):
     """Return all data points for a given party.
 
     Accepts party names like 'reform', 'labour', 'conservative',
     'lib_dem', 'green', 'snp', or 'other'.
     """
-    results = polling_store.get_by_party(name)
+    results = store.cached_get_by_party(name)
     if not results:
         raise HTTPException(
             status_code=404,
@@ -196,7 +550,7 @@ def get_by_party(name: str):
                 f"Valid parties: {', '.join(VALID_PARTIES)}"
             ),
         )
-    return results
+    return ORJSONResponse(results)
 
 
 @app.get(
@@ -205,9 +559,9 @@ def get_by_party(name: str):
     tags=["polls"],
     summary="Get trend data for all parties",
 )
-def get_trends():
+def get_trends(store: PollingStore = Depends(get_store)):
     """Return time-series trend data for every tracked party."""
-    return polling_store.get_trends()
+    return ORJSONResponse(store.cached_get_trends_data())
 
 
 @app.get(
@@ -219,13 +573,14 @@ def get_trends():
 def get_date_range(
     start: date = Query(description="Start date (YYYY-MM-DD)"),
     end: date = Query(description="End date (YYYY-MM-DD)"),
+    store: PollingStore = Depends(get_store),
 ):
     """Return polls whose fieldwork ended within the given date range."""
     if start > end:
         raise HTTPException(
             status_code=400, detail="start must be before end"
         )
-    results = polling_store.get_date_range(start, end)
+    results = store.cached_get_date_range(start, end)
     if not results:
         raise HTTPException(
             status_code=404,
@@ -239,10 +594,10 @@ def get_date_range(
     tags=["admin"],
     summary="Trigger a manual data refresh",
 )
-def trigger_refresh():
+def trigger_refresh(store: PollingStore = Depends(get_store)):
     """Manually trigger a refresh of polling data from the source."""
-    count = refresh_polling_data()
-    status = polling_store.get_status()
+    count = refresh_polling_data(store)
+    status = store.get_status()
     return {
         "message": f"Refreshed {count} polls",
         "source": status.source,
@@ -256,6 +611,6 @@ def trigger_refresh():
     tags=["info"],
     summary="Data store status",
 )
-def get_status():
+def get_status(store: PollingStore = Depends(get_store)):
     """Return metadata about the current polling data store."""
-    return polling_store.get_status()
+    return store.get_status()
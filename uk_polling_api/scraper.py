@@ -1,14 +1,18 @@
 """Scraper for UK voting intention polling data from Wikipedia."""
 
+import codecs
 import logging
 import re
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Optional
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup, Tag
+from lxml import etree
 
 from .models import PollResult
+from .store import PARTY_DISPLAY_NAMES
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +26,18 @@ USER_AGENT = (
     "(Educational governance research project; Python/requests)"
 )
 
+# Bytes read from the response per parser feed
+READ_CHUNK_SIZE = 64 * 1024
+
+# Elements whose text is not cell content. Wikipedia inlines TemplateStyles
+# <style> tags in tables, and their CSS (e.g. "font-size") would otherwise
+# leak into header matching
+NON_CONTENT_TAGS = ("style", "script")
+
+# Validators (ETag, Last-Modified) from the last successful scrape of each
+# URL, sent back so an unchanged page costs a 304 instead of a re-parse
+_validators: dict[str, tuple[Optional[str], Optional[str]]] = {}
+
 # Canonical party column names mapped from common header variations
 PARTY_COLUMN_MAP = {
     "con": "con",
@@ -42,13 +58,53 @@ PARTY_COLUMN_MAP = {
     "others": "other",
 }
 
+# Exact (lowercased) header text -> field, checked before the fuzzy rules
+HEADER_FIELD_MAP = {
+    **PARTY_COLUMN_MAP,
+    "date": "fieldwork",
+    "dates": "fieldwork",
+    "dates conducted": "fieldwork",
+    "fieldwork": "fieldwork",
+    "fieldwork date": "fieldwork",
+    "pollster": "pollster",
+    "polling organisation": "pollster",
+    "polling organisation/client": "pollster",
+    "client": "client",
+    "commissioner": "client",
+    "sample": "sample_size",
+    "sample size": "sample_size",
+    "area": "area",
+    "lead": "lead",
+}
+
+# Month names and abbreviations used in fieldwork dates
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+    "january": 1, "february": 2, "march": 3, "april": 4,
+    "june": 6, "july": 7, "august": 8, "september": 9,
+    "october": 10, "november": 11, "december": 12,
+}
+
+# Cell parsing patterns, compiled once rather than per cell
+_PCT_RE = re.compile(r"(\d+\.?\d*)")
+_SIZE_RE = re.compile(r"(\d{3,})")
+_YEAR_RE = re.compile(r"(20\d{2})")
+_RANGE_RE = re.compile(r"[–—\-−]")
+_DAY_RE = re.compile(r"(\d{1,2})")
+_DAYMON_RE = re.compile(r"(\d{1,2})\s+([A-Za-z]+)")
+
 
 def _parse_percentage(text: str) -> Optional[float]:
     """Extract a numeric percentage from a cell's text."""
     text = text.strip().replace("–", "").replace("—", "").replace("−", "")
     if not text or text == "N/A":
         return None
-    match = re.search(r"(\d+\.?\d*)", text)
+    # Fast path for plain "26" / "19.3" cells, which are nearly all of them
+    whole, _, fraction = text.partition(".")
+    if whole.isdecimal() and (not fraction or fraction.isdecimal()):
+        return float(text)
+    match = _PCT_RE.search(text)
     if match:
         return float(match.group(1))
     return None
@@ -57,7 +113,9 @@ def _parse_percentage(text: str) -> Optional[float]:
 def _parse_sample_size(text: str) -> Optional[int]:
     """Extract sample size from a cell, handling commas and ranges."""
     text = text.strip().replace(",", "").replace(" ", "")
-    match = re.search(r"(\d{3,})", text)
+    if len(text) >= 3 and text.isdecimal():
+        return int(text)
+    match = _SIZE_RE.search(text)
     if match:
         return int(match.group(1))
     return None
@@ -76,28 +134,19 @@ def _parse_date_text(text: str, year: Optional[int] = None) -> Optional[date]:
     if not text:
         return None
 
-    # Common month abbreviations
-    months = {
-        "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
-        "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
-        "january": 1, "february": 2, "march": 3, "april": 4,
-        "june": 6, "july": 7, "august": 8, "september": 9,
-        "october": 10, "november": 11, "december": 12,
-    }
-
     if not year:
-        year_match = re.search(r"20\d{2}", text)
+        year_match = _YEAR_RE.search(text)
         if year_match:
-            year = int(year_match.group())
+            year = int(year_match.group(1))
         else:
             year = date.today().year
 
     # Try to extract day and month
-    match = re.search(r"(\d{1,2})\s+([A-Za-z]+)", text)
+    match = _DAYMON_RE.search(text)
     if match:
         day = int(match.group(1))
         month_str = match.group(2).lower()
-        month = months.get(month_str)
+        month = MONTHS.get(month_str)
         if month and 1 <= day <= 31:
             try:
                 return date(year, month, day)
@@ -115,17 +164,17 @@ def _parse_fieldwork_dates(
         return None, None
 
     # Extract year if present
-    year_match = re.search(r"(20\d{2})", text)
+    year_match = _YEAR_RE.search(text)
     year = int(year_match.group(1)) if year_match else date.today().year
 
     # Split on common range separators
-    parts = re.split(r"[–—\-−]", text, maxsplit=1)
+    parts = _RANGE_RE.split(text, maxsplit=1)
     if len(parts) == 2:
         end_date = _parse_date_text(parts[1].strip(), year)
         start_date = _parse_date_text(parts[0].strip(), year)
         # If start didn't get a month, inherit from end
         if start_date is None and end_date is not None:
-            day_match = re.search(r"(\d{1,2})", parts[0].strip())
+            day_match = _DAY_RE.search(parts[0].strip())
             if day_match:
                 try:
                     start_date = date(year, end_date.month, int(day_match.group(1)))
@@ -137,66 +186,101 @@ def _parse_fieldwork_dates(
         return d, d
 
 
+@lru_cache(maxsize=1024)
+def _header_field(header: str) -> Optional[str]:
+    """Return the field a header cell maps to, or None."""
+    h = header.strip().lower()
+    field = HEADER_FIELD_MAP.get(h)
+    if field is not None:
+        return field
+    # Fuzzy fallback for header variants not in the map
+    if "date" in h or "fieldwork" in h:
+        return "fieldwork"
+    if "polling" in h or "pollster" in h or "organisation" in h:
+        return "pollster"
+    if "client" in h or "commissioner" in h:
+        return "client"
+    if "sample" in h or "size" in h:
+        return "sample_size"
+    if "area" in h:
+        return "area"
+    if "lead" in h:
+        return "lead"
+    return None
+
+
 def _identify_columns(header_cells: list[str]) -> dict[int, str]:
     """Map column indices to field names based on header text."""
     col_map = {}
     for i, header in enumerate(header_cells):
-        h = header.strip().lower()
-        if h in PARTY_COLUMN_MAP:
-            col_map[i] = PARTY_COLUMN_MAP[h]
-        elif "date" in h or "fieldwork" in h:
-            col_map[i] = "fieldwork"
-        elif "polling" in h or "pollster" in h or "organisation" in h:
-            col_map[i] = "pollster"
-        elif "client" in h or "commissioner" in h:
-            col_map[i] = "client"
-        elif "sample" in h or "size" in h:
-            col_map[i] = "sample_size"
-        elif "area" in h:
-            col_map[i] = "area"
-        elif "lead" in h:
-            col_map[i] = "lead"
+        field = _header_field(header)
+        if field is not None:
+            col_map[i] = field
     return col_map
 
 
-def _expand_rowspans(table: Tag) -> list[list[str]]:
-    """Expand a table with rowspan/colspan into a flat 2D list of cell texts."""
-    rows = table.find_all("tr")
+def _cell_text(element: lxml.html.HtmlElement) -> str:
+    """Concatenate an element's stripped text fragments, skipping comments."""
+    return "".join(fragment.strip() for fragment in element.itertext())
+
+
+def _header_charset(content_type: Optional[str]) -> Optional[str]:
+    """Return the charset named in a Content-Type header, if it is known."""
+    if not content_type:
+        return None
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset":
+            charset = value.strip().strip("\"'")
+            try:
+                codecs.lookup(charset)
+            except LookupError:
+                return None
+            return charset
+    return None
+
+
+def _expand_rowspans(table: lxml.html.HtmlElement) -> list[list[str]]:
+    """Expand a table with rowspan/colspan into a flat 2D list of cell texts.
+
+    ``<style>`` and ``<script>`` elements are removed from the table first.
+    """
+    etree.strip_elements(table, *NON_CONTENT_TAGS, with_tail=False)
+    rows = list(table.iter("tr"))
     if not rows:
         return []
 
-    # First pass: determine grid dimensions
-    max_cols = 0
-    for row in rows:
-        cols_in_row = 0
-        for cell in row.find_all(["th", "td"]):
-            colspan = int(cell.get("colspan", 1))
-            cols_in_row += colspan
-        max_cols = max(max_cols, cols_in_row)
+    # First pass: read each cell's spans once and size the grid
+    spans_by_row = [
+        [
+            (cell, int(cell.get("rowspan", 1)), int(cell.get("colspan", 1)))
+            for cell in row.iter("th", "td")
+        ]
+        for row in rows
+    ]
+    max_cols = max(
+        sum(colspan for _, _, colspan in spans) for spans in spans_by_row
+    )
 
     # Build grid
-    grid: list[list[Optional[str]]] = [
-        [None] * max_cols for _ in range(len(rows))
-    ]
+    n_rows = len(rows)
+    grid: list[list[Optional[str]]] = [[None] * max_cols for _ in range(n_rows)]
 
-    for row_idx, row in enumerate(rows):
+    for row_idx, spans in enumerate(spans_by_row):
+        grid_row = grid[row_idx]
         col_idx = 0
-        for cell in row.find_all(["th", "td"]):
+        for cell, rowspan, colspan in spans:
             # Find next empty column
-            while col_idx < max_cols and grid[row_idx][col_idx] is not None:
+            while col_idx < max_cols and grid_row[col_idx] is not None:
                 col_idx += 1
             if col_idx >= max_cols:
                 break
 
-            rowspan = int(cell.get("rowspan", 1))
-            colspan = int(cell.get("colspan", 1))
-            text = cell.get_text(strip=True)
-
-            for dr in range(rowspan):
-                for dc in range(colspan):
-                    r, c = row_idx + dr, col_idx + dc
-                    if r < len(grid) and c < max_cols:
-                        grid[r][c] = text
+            # Fill the spanned block one row slice at a time
+            col_end = min(col_idx + colspan, max_cols)
+            block_row = [_cell_text(cell)] * (col_end - col_idx)
+            for r in range(row_idx, min(row_idx + rowspan, n_rows)):
+                grid[r][col_idx:col_end] = block_row
 
             col_idx += colspan
 
@@ -204,18 +288,40 @@ def _expand_rowspans(table: Tag) -> list[list[str]]:
     return [[cell or "" for cell in row] for row in grid]
 
 
-def scrape_polls(url: str = WIKI_URL) -> list[PollResult]:
+def scrape_polls(url: str = WIKI_URL) -> Optional[list[PollResult]]:
     """Scrape UK voting intention polls from Wikipedia.
 
-    Returns a list of PollResult objects sorted by date (newest first).
+    Returns a list of PollResult objects sorted by date (newest first),
+    or None if the page is unchanged since the last successful scrape.
     """
     logger.info("Fetching polling data from %s", url)
     headers = {"User-Agent": USER_AGENT}
-    resp = requests.get(url, headers=headers, timeout=30)
-    resp.raise_for_status()
-
-    soup = BeautifulSoup(resp.text, "lxml")
-    tables = soup.find_all("table", class_="wikitable")
+    etag, last_modified = _validators.get(url, (None, None))
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    with requests.get(url, headers=headers, timeout=30, stream=True) as resp:
+        resp.raise_for_status()
+        if resp.status_code == 304:
+            logger.info("Polling page not modified since last scrape")
+            return None
+
+        # Feed the parser as the body arrives so parsing overlaps the
+        # download instead of waiting for the whole page
+        # Bytes are fed undecoded, so pass on the charset from the headers;
+        # without one the parser falls back to <meta charset> or its default
+        charset = _header_charset(resp.headers.get("content-type"))
+        parser = lxml.html.HTMLParser(encoding=charset)
+        for chunk in resp.iter_content(chunk_size=READ_CHUNK_SIZE):
+            parser.feed(chunk)
+        doc = parser.close()
+    etree.strip_elements(doc, *NON_CONTENT_TAGS, with_tail=False)
+
+    tables = doc.xpath(
+        "//table[contains(concat(' ', normalize-space(@class), ' '),"
+        " ' wikitable ')]"
+    )
     if not tables:
         logger.warning("No wikitable found on the page")
         return []
@@ -223,7 +329,7 @@ def scrape_polls(url: str = WIKI_URL) -> list[PollResult]:
     # The main voting intention table is typically the first large wikitable
     target_table = None
     for table in tables:
-        text = table.get_text(strip=True).lower()
+        text = _cell_text(table).lower()
         # The main table will contain all major party names
         if all(p in text for p in ["con", "lab", "reform", "green"]):
             target_table = table
@@ -262,6 +368,8 @@ def scrape_polls(url: str = WIKI_URL) -> list[PollResult]:
 
     polls: list[PollResult] = []
     party_fields = {"con", "lab", "lib_dem", "reform", "green", "snp", "other"}
+    # One shared str object per distinct pollster/client across all polls
+    interned: dict[str, str] = {}
 
     for row_idx in range(header_row_idx + 1, len(grid)):
         row = grid[row_idx]
@@ -315,20 +423,15 @@ def scrape_polls(url: str = WIKI_URL) -> list[PollResult]:
 
         lead_pct = round(best_val - second_val, 1) if second_val >= 0 else None
 
-        # Map internal party keys to display names
-        party_display = {
-            "con": "Conservative",
-            "lab": "Labour",
-            "lib_dem": "Liberal Democrats",
-            "reform": "Reform UK",
-            "green": "Green",
-            "snp": "SNP",
-            "other": "Other",
-        }
+        client = data.get("client")
+        if client is not None:
+            client = interned.setdefault(client, client)
 
-        poll = PollResult(
-            pollster=pollster,
-            client=data.get("client"),
+        # Every value below is already parsed to its field's type, so skip
+        # Pydantic's per-field validation
+        poll = PollResult.model_construct(
+            pollster=interned.setdefault(pollster, pollster),
+            client=client,
             fieldwork_start=data.get("fieldwork_start"),
             fieldwork_end=data.get("fieldwork_end"),
             sample_size=data.get("sample_size"),
@@ -339,13 +442,21 @@ def scrape_polls(url: str = WIKI_URL) -> list[PollResult]:
             green=party_values.get("green"),
             snp=party_values.get("snp"),
             other=party_values.get("other"),
-            lead_party=party_display.get(best_party, best_party) if best_party else None,
+            lead_party=(
+                PARTY_DISPLAY_NAMES.get(best_party, best_party)
+                if best_party else None
+            ),
             lead_pct=lead_pct,
             source_url=url,
         )
         polls.append(poll)
 
     logger.info("Scraped %d polls from Wikipedia", len(polls))
+    if polls:
+        _validators[url] = (
+            resp.headers.get("etag"),
+            resp.headers.get("last-modified"),
+        )
 
     # Sort by fieldwork_end descending (newest first)
     polls.sort(
@@ -1,10 +1,12 @@
-"""In-memory polling data store with thread-safe access."""
+"""In-memory polling data store with thread-safe, lock-free reads."""
 
 import logging
 import threading
-from datetime import date, datetime
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timezone
+from functools import lru_cache
 from statistics import mean
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from .models import PartyTrend, PollResult, PollSummary, PollingDataStatus
 
@@ -22,122 +24,228 @@ PARTY_DISPLAY_NAMES = {
     "other": "Other",
 }
 
+# Lowercased display name -> field (e.g. "reform uk" -> "reform")
+PARTY_REVERSE_MAP = {v.lower(): k for k, v in PARTY_DISPLAY_NAMES.items()}
+PARTY_FIELDS_SET = frozenset(PARTY_FIELDS)
+
+
+@lru_cache(maxsize=256)
+def _cached(store: "PollingStore", version: int, method: str, *args):
+    """Memoize a store getter for one data version.
+
+    ``version`` changes on every ``load()``, so entries for superseded data
+    are never hit again and simply age out of the LRU.
+    """
+    return getattr(store, method)(*args)
+
+
+class _Snapshot(NamedTuple):
+    """Immutable view of one load() of polling data.
+
+    ``PollingStore`` publishes a new snapshot with a single attribute
+    assignment, so readers never see a half-built set of indices.
+    """
+
+    polls: tuple[PollResult, ...]
+    # Polls with a fieldwork_end, newest first, and their end dates
+    # ascending so get_date_range can bisect them
+    dated: tuple[PollResult, ...]
+    end_dates: tuple[date, ...]
+    # Column-wise per-poll values, aligned with polls
+    columns: dict[str, tuple[Optional[float], ...]]
+    end_column: tuple[Optional[date], ...]
+    # Lowercased pollster name -> indices into polls
+    pollster_index: dict[str, tuple[int, ...]]
+    # Polls for each lowercased name that no other name contains, so an
+    # exact query for it can skip the substring scan
+    pollster_exact: dict[str, tuple[PollResult, ...]]
+    # Party field -> get_by_party() result: a {date, value, pollster} point
+    # for each poll reporting it. Shared by every caller; never mutated
+    party_points: dict[str, list[dict]]
+    last_refreshed: Optional[datetime]
+    source: str
+
+
+def _build_snapshot(
+    polls: list[PollResult],
+    source: str,
+    last_refreshed: Optional[datetime],
+) -> _Snapshot:
+    """Sort polls newest first and build the lookup structures for them."""
+    ordered = tuple(sorted(
+        polls,
+        key=lambda p: p.fieldwork_end or date.min,
+        reverse=True,
+    ))
+    dated = tuple(p for p in ordered if p.fieldwork_end is not None)
+
+    pollster_index: dict[str, list[int]] = {}
+    for i, p in enumerate(ordered):
+        pollster_index.setdefault(p.pollster.lower(), []).append(i)
+
+    pollster_exact = {
+        name: tuple(ordered[i] for i in indices)
+        for name, indices in pollster_index.items()
+        if not any(name in other and other != name for other in pollster_index)
+    }
+
+    columns = {
+        field: tuple(getattr(p, field) for p in ordered)
+        for field in PARTY_FIELDS
+    }
+    party_points = {
+        field: [
+            {
+                "date": p.fieldwork_end or p.fieldwork_start,
+                "value": value,
+                "pollster": p.pollster,
+            }
+            for p, value in zip(ordered, column)
+            if value is not None
+        ]
+        for field, column in columns.items()
+    }
+
+    return _Snapshot(
+        polls=ordered,
+        dated=dated,
+        end_dates=tuple(p.fieldwork_end for p in reversed(dated)),
+        columns=columns,
+        end_column=tuple(p.fieldwork_end for p in ordered),
+        pollster_index={
+            name: tuple(indices) for name, indices in pollster_index.items()
+        },
+        pollster_exact=pollster_exact,
+        party_points=party_points,
+        last_refreshed=last_refreshed,
+        source=source,
+    )
+
 
 class PollingStore:
-    """Thread-safe in-memory store for polling data."""
+    """Thread-safe in-memory store for polling data.
+
+    Reads are lock-free: every getter works on the snapshot it reads at
+    the start, and ``load()`` swaps in a whole new snapshot. The lock only
+    serializes concurrent loads.
+    """
 
     def __init__(self) -> None:
-        self._polls: list[PollResult] = []
+        self._snapshot = _build_snapshot([], source="none", last_refreshed=None)
         self._lock = threading.Lock()
-        self._last_refreshed: Optional[datetime] = None
-        self._source: str = "none"
+        self._version: int = 0
 
     @property
     def last_refreshed(self) -> Optional[datetime]:
-        return self._last_refreshed
+        return self._snapshot.last_refreshed
+
+    @property
+    def version(self) -> int:
+        """Counter bumped by every load(), for keying derived caches."""
+        return self._version
+
+    @property
+    def poll_count(self) -> int:
+        return len(self._snapshot.polls)
 
     def load(self, polls: list[PollResult], source: str = "unknown") -> int:
         """Replace all stored polls with new data. Returns count loaded."""
         with self._lock:
-            self._polls = sorted(
-                polls,
-                key=lambda p: p.fieldwork_end or date.min,
-                reverse=True,
+            snapshot = _build_snapshot(
+                polls, source=source, last_refreshed=datetime.now(timezone.utc)
             )
-            self._last_refreshed = datetime.utcnow()
-            self._source = source
-            logger.info("Loaded %d polls from %s", len(self._polls), source)
-            return len(self._polls)
+            self._snapshot = snapshot
+            # Bumped only after publishing, so a cache entry can never pair
+            # the new version with the old snapshot
+            self._version += 1
+            logger.info("Loaded %d polls from %s", len(snapshot.polls), source)
+            return len(snapshot.polls)
 
     def get_all(self) -> list[PollResult]:
-        with self._lock:
-            return list(self._polls)
+        return list(self._snapshot.polls)
 
     def get_latest(self, n: int = 10) -> list[PollResult]:
-        with self._lock:
-            return list(self._polls[:n])
+        return list(self._snapshot.polls[:n])
 
     def get_by_pollster(self, pollster: str) -> list[PollResult]:
-        with self._lock:
-            return [
-                p for p in self._polls
-                if pollster.lower() in p.pollster.lower()
-            ]
+        needle = pollster.strip().lower()
+        snap = self._snapshot
+        exact = snap.pollster_exact.get(needle)
+        if exact is not None:
+            return list(exact)
+        # Match against the distinct pollster names, not every poll
+        indices = sorted(
+            i
+            for name, name_indices in snap.pollster_index.items()
+            if needle in name
+            for i in name_indices
+        )
+        return [snap.polls[i] for i in indices]
 
     def get_by_party(self, party: str) -> list[dict]:
-        """Get all data points for a specific party."""
+        """Get all data points for a specific party.
+
+        Built with the snapshot, so every alias of a party (e.g.
+        "reform" and "Reform UK") returns the same list. Callers must not
+        mutate it.
+        """
         normalized = party.lower().strip()
         # Resolve display names first (e.g. "Reform UK" -> "reform")
-        reverse_map = {v.lower(): k for k, v in PARTY_DISPLAY_NAMES.items()}
-        if normalized in reverse_map:
-            field = reverse_map[normalized]
-        else:
-            field = normalized.replace(" ", "_")
-        if field not in PARTY_FIELDS:
+        field = PARTY_REVERSE_MAP.get(normalized, normalized.replace(" ", "_"))
+        if field not in PARTY_FIELDS_SET:
             return []
 
-        with self._lock:
-            results = []
-            for p in self._polls:
-                value = getattr(p, field, None)
-                if value is not None:
-                    results.append({
-                        "date": (p.fieldwork_end or p.fieldwork_start),
-                        "value": value,
-                        "pollster": p.pollster,
-                    })
-            return results
+        return self._snapshot.party_points[field]
 
     def get_date_range(
         self, start: date, end: date
     ) -> list[PollResult]:
-        with self._lock:
-            return [
-                p for p in self._polls
-                if p.fieldwork_end
-                and start <= p.fieldwork_end <= end
-            ]
+        snap = self._snapshot
+        count = len(snap.end_dates)
+        lo = bisect_left(snap.end_dates, start)
+        hi = bisect_right(snap.end_dates, end)
+        # dated is newest first, so the ascending [lo, hi) maps back to a
+        # reversed slice
+        return list(snap.dated[count - hi:count - lo])
 
     def get_summary(self, n: int = 10) -> Optional[PollSummary]:
         """Compute an average summary of the last n polls."""
-        with self._lock:
-            recent = self._polls[:n]
+        snap = self._snapshot
+        recent_end_dates = snap.end_column[:n]
+        recent_columns = [snap.columns[field][:n] for field in PARTY_FIELDS]
+        poll_count = len(recent_end_dates)
 
-        if not recent:
+        if not poll_count:
             return None
 
+        # Build the averages while tracking the top two. mean() sums
+        # exactly, so values that land on a rounding tie round the same
+        # way regardless of the order they are added in
         averages: dict[str, Optional[float]] = {}
-        for field in PARTY_FIELDS:
-            values = [
-                getattr(p, field) for p in recent
-                if getattr(p, field) is not None
-            ]
-            averages[PARTY_DISPLAY_NAMES[field]] = (
-                round(mean(values), 1) if values else None
-            )
-
-        # Determine leader
-        leader = max(
-            averages,
-            key=lambda k: averages[k] if averages[k] is not None else -1,
-        )
-        leader_val = averages[leader] or 0.0
+        leader = PARTY_DISPLAY_NAMES[PARTY_FIELDS[0]]
+        leader_val: Optional[float] = None
+        second_val: Optional[float] = None
+        for field, column in zip(PARTY_FIELDS, recent_columns):
+            name = PARTY_DISPLAY_NAMES[field]
+            values = [v for v in column if v is not None]
+            average = round(mean(values), 1) if values else None
+            averages[name] = average
+            if average is None:
+                continue
+            if leader_val is None or average > leader_val:
+                second_val = leader_val
+                leader, leader_val = name, average
+            elif second_val is None or average > second_val:
+                second_val = average
 
-        # Second place
-        second_val = max(
-            (v for k, v in averages.items() if k != leader and v is not None),
-            default=0.0,
-        )
-        lead_margin = round(leader_val - second_val, 1)
+        lead_margin = round((leader_val or 0.0) - (second_val or 0.0), 1)
 
-        dates = [
-            p.fieldwork_end for p in recent if p.fieldwork_end is not None
-        ]
+        dates = [d for d in recent_end_dates if d is not None]
 
         return PollSummary(
             period_start=min(dates) if dates else date.today(),
             period_end=max(dates) if dates else date.today(),
-            poll_count=len(recent),
+            poll_count=poll_count,
             averages=averages,
             leader=leader,
             lead_margin=lead_margin,
@@ -145,32 +253,64 @@ class PollingStore:
 
     def get_trends(self) -> list[PartyTrend]:
         """Get trend data for all parties."""
-        trends = []
-        for field in PARTY_FIELDS:
-            data_points = self.get_by_party(field)
-            if data_points:
-                trends.append(PartyTrend(
-                    party=PARTY_DISPLAY_NAMES[field],
-                    data_points=[
-                        {"date": str(dp["date"]), "value": dp["value"]}
-                        for dp in data_points
-                    ],
-                ))
-        return trends
+        return [PartyTrend(**trend) for trend in self.get_trends_data()]
+
+    def get_trends_data(self) -> list[dict]:
+        """Get trend data for all parties as plain JSON-ready dicts."""
+        snap = self._snapshot
+        buckets: list[list[dict]] = [[] for _ in PARTY_FIELDS]
+        rows = zip(*(snap.columns[field] for field in PARTY_FIELDS))
+        for poll, row in zip(snap.polls, rows):
+            poll_date = poll.fieldwork_end or poll.fieldwork_start
+            if poll_date is None:
+                continue
+            # Formatted once per poll rather than once per party
+            date_str = poll_date.isoformat()
+            for bucket, value in zip(buckets, row):
+                if value is not None:
+                    bucket.append({"date": date_str, "value": value})
+
+        return [
+            {"party": PARTY_DISPLAY_NAMES[field], "data_points": points}
+            for field, points in zip(PARTY_FIELDS, buckets)
+            if points
+        ]
 
     def get_status(self) -> PollingDataStatus:
-        with self._lock:
-            dates = [
-                p.fieldwork_end for p in self._polls
-                if p.fieldwork_end is not None
-            ]
-            return PollingDataStatus(
-                total_polls=len(self._polls),
-                latest_poll_date=max(dates) if dates else None,
-                oldest_poll_date=min(dates) if dates else None,
-                last_refreshed=self._last_refreshed,
-                source=self._source,
-            )
+        snap = self._snapshot
+        dated = snap.dated
+        return PollingDataStatus(
+            total_polls=len(snap.polls),
+            latest_poll_date=dated[0].fieldwork_end if dated else None,
+            oldest_poll_date=dated[-1].fieldwork_end if dated else None,
+            last_refreshed=snap.last_refreshed,
+            source=snap.source,
+        )
+
+    # ── Memoized getters ───────────────────────────────────────────────
+    #
+    # The data only changes on load(), so the endpoints read through these
+    # wrappers. Results are shared between callers and must not be mutated.
+
+    def cached_get_latest(self, n: int = 10) -> list[PollResult]:
+        return _cached(self, self._version, "get_latest", n)
+
+    def cached_get_by_pollster(self, pollster: str) -> list[PollResult]:
+        return _cached(
+            self, self._version, "get_by_pollster", pollster.strip().lower()
+        )
+
+    def cached_get_by_party(self, party: str) -> list[dict]:
+        return _cached(self, self._version, "get_by_party", party)
+
+    def cached_get_date_range(self, start: date, end: date) -> list[PollResult]:
+        return _cached(self, self._version, "get_date_range", start, end)
+
+    def cached_get_summary(self, n: int = 10) -> Optional[PollSummary]:
+        return _cached(self, self._version, "get_summary", n)
+
+    def cached_get_trends_data(self) -> list[dict]:
+        return _cached(self, self._version, "get_trends_data")
 
 
 # Singleton instance
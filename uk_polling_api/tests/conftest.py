@@ -0,0 +1,147 @@
+"""Shared fixtures for the UK Polling API tests."""
+
+from datetime import date
+from urllib.parse import urlencode
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+
+from uk_polling_api.app import CACHE_DIR_ENV, app, get_store
+from uk_polling_api.models import PollResult
+from uk_polling_api.seed_data import SEED_POLLS
+from uk_polling_api.store import PollingStore
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: deselect with -m 'not slow'")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless a marker expression was given with -m."""
+    if config.getoption("-m"):
+        return
+    skip = pytest.mark.skip(reason="use -m slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip)
+
+
+# Validated once; make_poll clones it without re-validating
+_TEMPLATE = PollResult(
+    pollster="TestPoll",
+    client="TestClient",
+    fieldwork_start=date(2026, 1, 1),
+    fieldwork_end=date(2026, 1, 2),
+    sample_size=1000,
+    con=20,
+    lab=22,
+    lib_dem=11,
+    reform=28,
+    green=12,
+    snp=3,
+    other=4,
+    lead_party="Reform UK",
+    lead_pct=6.0,
+)
+
+
+@pytest.fixture(scope="session")
+def make_poll():
+    """Factory for test polls: the template with the given fields replaced."""
+    def _make_poll(**overrides) -> PollResult:
+        return _TEMPLATE.model_copy(update=overrides)
+
+    return _make_poll
+
+
+@pytest.fixture(scope="session")
+def seeded_store():
+    """A store of its own for the API tests, loaded with the seed data.
+
+    Keeping it separate from the module-level ``polling_store`` means no
+    process-global state is mutated, so the suite can run under xdist.
+    """
+    store = PollingStore()
+    store.load(SEED_POLLS, source="test")
+    return store
+
+
+@pytest.fixture(scope="session")
+def _store_override(seeded_store):
+    """Point the app's ``get_store`` dependency at ``seeded_store``."""
+    app.dependency_overrides[get_store] = lambda: seeded_store
+    yield
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="session")
+def client(_store_override):
+    """Session client; entering it runs the app lifespan once.
+
+    Startup is kept hermetic: the scraper reports the page unchanged, so
+    it never touches the network, and any developer disk cache is ignored.
+    The seeded store is therefore what every test sees.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("uk_polling_api.scraper.scrape_polls", lambda *a, **k: None)
+        mp.delenv(CACHE_DIR_ENV, raising=False)
+        with TestClient(app) as c:
+            yield c
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    # Session-scoped so the async client below can be shared too
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def aclient(_store_override):
+    """Async client calling the app in-process, for concurrent requests."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+async def _asgi_get(path, **params):
+    """GET *path* straight through the ASGI app; returns (status, JSON body).
+
+    Skips httpx request/response construction, for hot JSON endpoints. No
+    lifespan runs, so the store must already be loaded.
+    """
+    status = 0
+    body = bytearray()
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("test", 80),
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": urlencode(params).encode(),
+        "headers": [(b"host", b"test")],
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, orjson.loads(body)
+
+
+@pytest.fixture(scope="session")
+def asgi_get(_store_override):
+    """The ``_asgi_get`` helper, with the seeded store bound."""
+    return _asgi_get
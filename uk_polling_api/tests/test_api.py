@@ -1,201 +1,422 @@
 """Tests for the UK Polling API endpoints."""
 
+import asyncio
+import os
+from urllib.parse import urlencode
+
 import pytest
-from fastapi.testclient import TestClient
 
-from uk_polling_api.app import app
+from uk_polling_api import app as app_module
 from uk_polling_api.seed_data import SEED_POLLS
-from uk_polling_api.store import polling_store
-
-
-@pytest.fixture(autouse=True)
-def _load_seed_data():
-    """Ensure seed data is loaded before each test."""
-    polling_store.load(SEED_POLLS, source="test")
+from uk_polling_api.store import PollingStore, polling_store
+
+# Seed data is static, so expected values are derived once at import
+_SEED_COUNT = len(SEED_POLLS)
+_SEED_MAX_DATE = max(
+    (p.fieldwork_end for p in SEED_POLLS if p.fieldwork_end), default=None,
+)
+_EXPECTED_LATEST5 = sorted(
+    (p.fieldwork_end.isoformat() for p in SEED_POLLS if p.fieldwork_end),
+    reverse=True,
+)[:5]
+
+EXPECTED_POLL_KEYS = {
+    "pollster", "con", "lab", "reform", "green", "lib_dem", "lead_party",
+}
+EXPECTED_SUMMARY_KEYS = {"averages", "leader", "lead_margin", "poll_count"}
+EXPECTED_STATUS_KEYS = {
+    "total_polls", "latest_poll_date", "last_refreshed", "source",
+}
+EXPECTED_PARTIES = {
+    "Conservative", "Labour", "Liberal Democrats", "Reform UK", "Green",
+}
+EXPECTED_TREND_PARTIES = {"Reform UK", "Labour", "Conservative"}
+
+
+_WARMUP_PATHS = (
+    "/",
+    "/polls",
+    "/polls/latest",
+    "/polls/summary",
+    "/polls/trends",
+    "/status",
+    "/polls/pollster/YouGov",
+    "/polls/party/reform",
+    "/polls/range?start=2026-01-01&end=2026-02-28",
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup(client):
+    """Hit each read endpoint once so first-call setup lands outside tests."""
+    for path in _WARMUP_PATHS:
+        client.get(path)
+
+
+@pytest.fixture
+def reseed(seeded_store):
+    """Restore the session's seed data after a test that reloads the store."""
     yield
-
-
-client = TestClient(app, raise_server_exceptions=False)
+    seeded_store.load(SEED_POLLS, source="test")
 
 
 class TestRoot:
-    def test_root_returns_api_info(self):
+    def test_root_returns_api_info(self, client):
         resp = client.get("/")
         assert resp.status_code == 200
         data = resp.json()
         assert data["name"] == "UK Polling Voting Intentions API"
         assert "endpoints" in data
 
-    def test_docs_available(self):
+    @pytest.mark.slow
+    def test_docs_available(self, client):
         resp = client.get("/docs")
         assert resp.status_code == 200
 
 
+@pytest.fixture(scope="class")
+def latest_default_payload(client):
+    resp = client.get("/polls/latest")
+    assert resp.status_code == 200
+    return resp.json()
+
+
+@pytest.fixture(scope="class")
+def summary_payload(client):
+    resp = client.get("/polls/summary")
+    assert resp.status_code == 200
+    return resp.json()
+
+
 class TestLatestPolls:
-    def test_default_returns_10(self):
-        resp = client.get("/polls/latest")
-        assert resp.status_code == 200
-        data = resp.json()
-        assert len(data) == 10
+    def test_default_returns_10(self, latest_default_payload):
+        assert len(latest_default_payload) == 10
 
-    def test_custom_count(self):
-        resp = client.get("/polls/latest?n=3")
-        assert resp.status_code == 200
-        data = resp.json()
-        assert len(data) == 3
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("n", [3, 5])
+    async def test_custom_count(self, asgi_get, n):
+        status, data = await asgi_get("/polls/latest", n=n)
+        assert status == 200
+        assert len(data) == n
 
-    def test_sorted_newest_first(self):
-        resp = client.get("/polls/latest?n=5")
-        data = resp.json()
-        dates = [p["fieldwork_end"] for p in data if p["fieldwork_end"]]
-        assert dates == sorted(dates, reverse=True)
+    @pytest.mark.anyio
+    async def test_sorted_newest_first(self, asgi_get):
+        _, data = await asgi_get("/polls/latest", n=5)
+        assert [p["fieldwork_end"] for p in data] == _EXPECTED_LATEST5
 
-    def test_poll_has_expected_fields(self):
-        resp = client.get("/polls/latest?n=1")
-        poll = resp.json()[0]
-        assert "pollster" in poll
-        assert "con" in poll
-        assert "lab" in poll
-        assert "reform" in poll
-        assert "green" in poll
-        assert "lib_dem" in poll
-        assert "lead_party" in poll
+    def test_poll_has_expected_fields(self, latest_default_payload):
+        assert EXPECTED_POLL_KEYS <= latest_default_payload[0].keys()
 
 
 class TestAllPolls:
-    def test_returns_all_polls(self):
+    @pytest.mark.slow
+    def test_returns_all_polls(self, client):
         resp = client.get("/polls")
         assert resp.status_code == 200
         data = resp.json()
-        assert len(data) == len(SEED_POLLS)
+        assert len(data) == _SEED_COUNT
 
 
 class TestSummary:
-    def test_summary_returns_averages(self):
-        resp = client.get("/polls/summary")
-        assert resp.status_code == 200
-        data = resp.json()
-        assert "averages" in data
-        assert "leader" in data
-        assert "lead_margin" in data
-        assert "poll_count" in data
-        assert data["poll_count"] == 10
-
-    def test_summary_custom_n(self):
-        resp = client.get("/polls/summary?n=5")
-        data = resp.json()
-        assert data["poll_count"] == 5
+    def test_summary_returns_averages(self, summary_payload):
+        assert EXPECTED_SUMMARY_KEYS <= summary_payload.keys()
+        assert summary_payload["poll_count"] == 10
 
-    def test_averages_contain_all_parties(self):
-        resp = client.get("/polls/summary")
-        averages = resp.json()["averages"]
-        for party in [
-            "Conservative", "Labour", "Liberal Democrats",
-            "Reform UK", "Green",
-        ]:
-            assert party in averages
-            assert isinstance(averages[party], (int, float))
+    @pytest.mark.parametrize("n", [3, 5])
+    def test_summary_custom_n(self, client, n):
+        resp = client.get(f"/polls/summary?n={n}")
+        assert resp.json()["poll_count"] == n
+
+    def test_averages_contain_all_parties(self, summary_payload):
+        averages = summary_payload["averages"]
+        assert EXPECTED_PARTIES <= averages.keys()
+        assert all(
+            isinstance(averages[party], (int, float))
+            for party in EXPECTED_PARTIES
+        )
 
 
 class TestByPollster:
-    def test_yougov(self):
+    def test_yougov(self, client):
         resp = client.get("/polls/pollster/YouGov")
         assert resp.status_code == 200
         data = resp.json()
         assert len(data) > 0
-        assert all("YouGov" in p["pollster"] for p in data)
+        # Check each distinct name once rather than every row
+        pollsters = {p["pollster"] for p in data}
+        assert all("YouGov" in name for name in pollsters)
 
-    def test_case_insensitive(self):
+    def test_case_insensitive(self, client):
         resp = client.get("/polls/pollster/yougov")
         assert resp.status_code == 200
         assert len(resp.json()) > 0
 
-    def test_not_found(self):
+    def test_not_found(self, client):
         resp = client.get("/polls/pollster/nonexistent")
         assert resp.status_code == 404
 
 
+@pytest.mark.anyio
 class TestByParty:
-    def test_reform(self):
-        resp = client.get("/polls/party/reform")
-        assert resp.status_code == 200
-        data = resp.json()
+    async def test_all_parties(self, aclient):
+        reform, labour, conservative = await asyncio.gather(
+            aclient.get("/polls/party/reform"),
+            aclient.get("/polls/party/labour"),
+            aclient.get("/polls/party/conservative"),
+        )
+        assert reform.status_code == 200
+        data = reform.json()
         assert len(data) > 0
-        assert all("value" in dp for dp in data)
-        assert all("date" in dp for dp in data)
-
-    def test_labour(self):
-        resp = client.get("/polls/party/labour")
-        assert resp.status_code == 200
-        assert len(resp.json()) > 0
+        assert all({"value", "date"} <= dp.keys() for dp in data)
 
-    def test_conservative(self):
-        resp = client.get("/polls/party/conservative")
-        assert resp.status_code == 200
-        assert len(resp.json()) > 0
+        for resp in (labour, conservative):
+            assert resp.status_code == 200
+            assert len(resp.json()) > 0
 
-    def test_invalid_party(self):
-        resp = client.get("/polls/party/pirate")
+    async def test_invalid_party(self, aclient):
+        resp = await aclient.get("/polls/party/pirate")
         assert resp.status_code == 404
 
 
+@pytest.mark.anyio
 class TestTrends:
-    def test_trends_returns_all_parties(self):
-        resp = client.get("/polls/trends")
+    async def test_trends(self, aclient):
+        resp = await aclient.get("/polls/trends")
         assert resp.status_code == 200
         data = resp.json()
-        party_names = {t["party"] for t in data}
-        assert "Reform UK" in party_names
-        assert "Labour" in party_names
-        assert "Conservative" in party_names
 
-    def test_trend_has_data_points(self):
-        resp = client.get("/polls/trends")
-        data = resp.json()
+        assert EXPECTED_TREND_PARTIES <= {t["party"] for t in data}
+
         for trend in data:
             assert len(trend["data_points"]) > 0
-            assert "date" in trend["data_points"][0]
-            assert "value" in trend["data_points"][0]
+            assert {"date", "value"} <= trend["data_points"][0].keys()
 
 
-class TestDateRange:
-    def test_valid_range(self):
-        resp = client.get("/polls/range?start=2026-01-01&end=2026-02-28")
-        assert resp.status_code == 200
-        data = resp.json()
-        assert len(data) > 0
+def _range_url(start, end):
+    return "/polls/range?" + urlencode({"start": start, "end": end})
 
-    def test_narrow_range(self):
-        resp = client.get("/polls/range?start=2026-02-01&end=2026-02-04")
-        assert resp.status_code == 200
-        data = resp.json()
-        assert len(data) >= 1
 
-    def test_inverted_range(self):
-        resp = client.get("/polls/range?start=2026-03-01&end=2026-01-01")
-        assert resp.status_code == 400
+# (url, expected status, minimum number of polls returned on a 200)
+_RANGE_CASES = [
+    pytest.param(_range_url("2026-01-01", "2026-02-28"), 200, 1, id="valid"),
+    pytest.param(_range_url("2026-02-01", "2026-02-04"), 200, 1, id="narrow"),
+    pytest.param(_range_url("2026-03-01", "2026-01-01"), 400, 0, id="inverted"),
+    pytest.param(_range_url("2020-01-01", "2020-01-31"), 404, 0, id="empty"),
+]
 
-    def test_empty_range(self):
-        resp = client.get("/polls/range?start=2020-01-01&end=2020-01-31")
-        assert resp.status_code == 404
+
+class TestDateRange:
+    @pytest.mark.parametrize("url,status,min_count", _RANGE_CASES)
+    def test_date_range(self, client, url, status, min_count):
+        resp = client.get(url)
+        assert resp.status_code == status
+        if status == 200:
+            assert len(resp.json()) >= min_count
 
 
 class TestStatus:
-    def test_status_fields(self):
+    def test_status_fields(self, client):
         resp = client.get("/status")
         assert resp.status_code == 200
         data = resp.json()
-        assert "total_polls" in data
-        assert "latest_poll_date" in data
-        assert "last_refreshed" in data
-        assert "source" in data
-        assert data["total_polls"] == len(SEED_POLLS)
+        assert EXPECTED_STATUS_KEYS <= data.keys()
+        assert data["total_polls"] == _SEED_COUNT
+        assert data["latest_poll_date"] == _SEED_MAX_DATE.isoformat()
+
+    def test_served_from_injected_store(self, client, seeded_store):
+        resp = client.get("/status")
+        assert resp.json()["source"] == seeded_store.get_status().source
+        assert polling_store.poll_count == 0
 
 
+@pytest.mark.usefixtures("reseed")
 class TestRefresh:
-    def test_manual_refresh(self):
+    @pytest.mark.slow
+    def test_manual_refresh(self, client):
         resp = client.post("/polls/refresh")
         assert resp.status_code == 200
         data = resp.json()
         assert "message" in data
         assert "source" in data
+
+
+class TestETag:
+    def test_read_endpoint_has_etag(self, client):
+        resp = client.get("/polls/latest")
+        assert resp.status_code == 200
+        assert resp.headers["etag"]
+
+    def test_matching_etag_returns_304(self, client):
+        etag = client.get("/polls/summary").headers["etag"]
+        resp = client.get("/polls/summary", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.headers["etag"] == etag
+        assert resp.content == b""
+
+    @pytest.mark.parametrize("header", [
+        pytest.param(lambda etag: f"W/{etag}", id="weak"),
+        pytest.param(lambda etag: f'"other", {etag}', id="list"),
+        pytest.param(lambda etag: "*", id="wildcard"),
+    ])
+    def test_if_none_match_forms_return_304(self, client, header):
+        etag = client.get("/polls/summary").headers["etag"]
+        resp = client.get(
+            "/polls/summary", headers={"If-None-Match": header(etag)},
+        )
+        assert resp.status_code == 304
+        assert resp.headers["etag"] == etag
+
+    @pytest.mark.parametrize(
+        "cached", [True, False], ids=["cached", "computed"],
+    )
+    def test_304_keeps_cors_headers(self, client, monkeypatch, cached):
+        origin = {"Origin": "https://example.org"}
+        full = client.get("/polls/summary", headers=origin)
+        if not cached:
+            monkeypatch.setattr(app_module, "_etag_cache", {})
+        resp = client.get(
+            "/polls/summary",
+            headers={"If-None-Match": full.headers["etag"], **origin},
+        )
+        assert resp.status_code == 304
+        for name in ("access-control-allow-origin", "vary"):
+            assert resp.headers[name] == full.headers[name]
+
+    def test_stale_etag_returns_body(self, client):
+        resp = client.get("/status", headers={"If-None-Match": '"stale"'})
+        assert resp.status_code == 200
+        assert resp.json()["total_polls"] == _SEED_COUNT
+
+    def test_errors_are_not_tagged(self, client):
+        resp = client.get("/polls/pollster/nonexistent")
+        assert resp.status_code == 404
+        assert "etag" not in resp.headers
+
+
+@pytest.mark.usefixtures("reseed")
+class TestSeedFallback:
+    @pytest.fixture
+    def failing_scrape(self, monkeypatch):
+        def _fail(*args, **kwargs):
+            raise ConnectionError("offline")
+
+        monkeypatch.setattr("uk_polling_api.scraper.scrape_polls", _fail)
+
+    def test_empty_store_loads_seed_data(self, failing_scrape, seeded_store):
+        seeded_store.load([], source="test")
+        assert app_module.refresh_polling_data(seeded_store) == _SEED_COUNT
+        assert seeded_store.get_status().source == "seed_data"
+
+    def test_loaded_store_is_kept(self, failing_scrape, seeded_store):
+        version = seeded_store.version
+        assert app_module.refresh_polling_data(seeded_store) == 0
+        assert seeded_store.version == version
+        assert seeded_store.get_status().source == "test"
+
+
+@pytest.mark.usefixtures("reseed")
+class TestDiskCache:
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(app_module.CACHE_DIR_ENV, str(tmp_path))
+        monkeypatch.setattr(app_module, "_disk_cache_mtime", None)
+        return tmp_path
+
+    def test_disabled_without_env(self, monkeypatch, seeded_store):
+        monkeypatch.delenv(app_module.CACHE_DIR_ENV, raising=False)
+        app_module._save_disk_cache(SEED_POLLS[:2])
+        assert app_module._load_disk_cache(seeded_store) == 0
+
+    def test_unchanged_file_not_reloaded(self, cache_dir, seeded_store):
+        app_module._save_disk_cache(SEED_POLLS[:2])
+        assert app_module._load_disk_cache(seeded_store) == 2
+        assert app_module._load_disk_cache(seeded_store) == 0
+
+    def test_round_trip(self, cache_dir, seeded_store):
+        app_module._save_disk_cache(SEED_POLLS[:2])
+        assert app_module._load_disk_cache(seeded_store) == 2
+        status = seeded_store.get_status()
+        assert status.source == "disk_cache"
+        assert status.total_polls == 2
+
+    def test_save_leaves_no_temp_files(self, cache_dir):
+        app_module._save_disk_cache(SEED_POLLS[:2])
+        assert os.listdir(cache_dir) == [app_module.CACHE_FILENAME]
+
+    def test_waiting_worker_does_not_scrape(self, cache_dir, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            "uk_polling_api.scraper.scrape_polls",
+            lambda *a, **k: calls.append(a),
+        )
+        store = PollingStore()
+        app_module._load_initial_data(store, is_scraper=False)
+        assert calls == []
+        assert store.get_status().source == "seed_data"
+
+    def test_waiting_worker_uses_disk_cache(self, cache_dir):
+        app_module._save_disk_cache(SEED_POLLS[:2])
+        store = PollingStore()
+        app_module._load_initial_data(store, is_scraper=False)
+        assert store.get_status().source == "disk_cache"
+
+    @staticmethod
+    def _age_cache(cache_dir, seconds):
+        path = cache_dir / app_module.CACHE_FILENAME
+        mtime = os.stat(path).st_mtime - seconds
+        os.utime(path, (mtime, mtime))
+
+    def test_stale_cache_ignored(self, cache_dir, seeded_store):
+        app_module._save_disk_cache(SEED_POLLS[:2])
+        self._age_cache(cache_dir, app_module.DISK_CACHE_MAX_AGE_SECONDS)
+        assert app_module._load_disk_cache(seeded_store) == 0
+
+    def test_cache_fresh_through_jittered_refresh(
+        self, cache_dir, seeded_store,
+    ):
+        app_module._save_disk_cache(SEED_POLLS[:2])
+        self._age_cache(
+            cache_dir,
+            app_module.REFRESH_INTERVAL_HOURS * 3600
+            + app_module.REFRESH_JITTER_SECONDS,
+        )
+        assert app_module._load_disk_cache(seeded_store) == 2
+
+    def test_unchanged_page_keeps_cache_fresh(
+        self, cache_dir, seeded_store, monkeypatch,
+    ):
+        app_module._save_disk_cache(SEED_POLLS[:2])
+        self._age_cache(cache_dir, app_module.DISK_CACHE_MAX_AGE_SECONDS)
+        monkeypatch.setattr(
+            "uk_polling_api.scraper.scrape_polls", lambda *a, **k: None,
+        )
+        assert app_module.refresh_polling_data(seeded_store) == 0
+
+        store = PollingStore()
+        app_module._load_initial_data(store, is_scraper=False)
+        assert store.get_status().source == "disk_cache"
+
+
+class TestRefreshLock:
+    @pytest.fixture
+    def lock_path(self, tmp_path, monkeypatch):
+        pytest.importorskip("fcntl")
+        monkeypatch.setenv(app_module.CACHE_DIR_ENV, str(tmp_path))
+        monkeypatch.setattr(app_module, "_refresh_lock_file", None)
+        yield tmp_path / app_module.REFRESH_LOCK_FILENAME
+        app_module._release_refresh_lock()
+
+    def test_first_worker_scrapes(self, lock_path):
+        assert app_module._acquire_refresh_lock() is True
+        assert lock_path.exists()
+
+    def test_other_workers_do_not_scrape(self, lock_path):
+        import fcntl
+
+        with open(lock_path, "a") as held:
+            fcntl.flock(held, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            assert app_module._acquire_refresh_lock() is False
+
+    def test_unusable_cache_dir_scrapes(self, lock_path, monkeypatch, tmp_path):
+        monkeypatch.setenv(app_module.CACHE_DIR_ENV, str(tmp_path / "missing"))
+        assert app_module._acquire_refresh_lock() is True
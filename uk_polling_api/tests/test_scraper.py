@@ -2,90 +2,117 @@
 
 from datetime import date
 
+import lxml.html
+import pytest
+
+from uk_polling_api import scraper
+from uk_polling_api.models import PollResult
 from uk_polling_api.scraper import (
+    _expand_rowspans,
+    _header_charset,
     _identify_columns,
     _parse_date_text,
     _parse_fieldwork_dates,
     _parse_percentage,
     _parse_sample_size,
+    scrape_polls,
 )
 
-
-class TestParsePercentage:
-    def test_integer(self):
-        assert _parse_percentage("26") == 26.0
-
-    def test_decimal(self):
-        assert _parse_percentage("19.3") == 19.3
-
-    def test_with_whitespace(self):
-        assert _parse_percentage("  14  ") == 14.0
-
-    def test_dash_returns_none(self):
-        assert _parse_percentage("–") is None
-
-    def test_empty_returns_none(self):
-        assert _parse_percentage("") is None
-
-    def test_na_returns_none(self):
-        assert _parse_percentage("N/A") is None
-
-    def test_with_surrounding_text(self):
-        assert _parse_percentage("26%") == 26.0
+POLLING_PAGE = b"""<html><body>
+<table class="wikitable sortable">
+<tr><th>Dates conducted</th><th>Pollster</th><th>Client</th>
+<th>Sample size</th><th>Con</th><th>Lab</th><th>Lib Dem</th>
+<th>Reform</th><th>Green</th><th>Others</th><th>Lead</th></tr>
+<tr><td>3&#8211;4 Feb 2026</td><td>YouGov</td><td>The Times</td>
+<td>2,089</td><td>18%</td><td>19%</td><td>12%</td><td>26%</td>
+<td>14%</td><td>11%</td><td>7</td></tr>
+<tr><td>1&#8211;4 Feb 2026</td><td rowspan="2"><a>Find Out Now</a></td>
+<td>Electoral Calculus</td><td>3,024</td><td>19%</td><td>19%</td>
+<td>11%</td><td>28%</td><td>13%</td><td>10%</td><td>9</td></tr>
+<tr><td>28 Jan &#8211; 1 Feb 2026</td><td></td><td>2,000</td>
+<td>20%</td><td>21%</td><td>12%</td><td>27%</td><td>11%</td>
+<td>9%</td><td>6</td></tr>
+<tr><td>20&#8211;21 Jan 2026</td><td>YouGov</td><td>The Times</td>
+<td>2,150</td><td>19%</td><td>20%</td><td>13%</td><td>25%</td>
+<td>13%</td><td>10%</td><td>5</td></tr>
+</table>
+</body></html>"""
 
 
-class TestParseSampleSize:
-    def test_simple_number(self):
-        assert _parse_sample_size("2089") == 2089
+class _FakeResponse:
+    def __init__(self, content: bytes, status_code: int = 200, headers=None):
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {}
 
-    def test_with_comma(self):
-        assert _parse_sample_size("2,089") == 2089
+    def __enter__(self):
+        return self
 
-    def test_with_spaces(self):
-        assert _parse_sample_size("2 089") == 2089
+    def __exit__(self, *exc_info):
+        return False
 
-    def test_empty(self):
-        assert _parse_sample_size("") is None
+    def raise_for_status(self):
+        pass
 
-    def test_small_number_ignored(self):
-        assert _parse_sample_size("12") is None
+    def iter_content(self, chunk_size):
+        # Small chunks so cells are split across parser feeds
+        for i in range(0, len(self.content), 100):
+            yield self.content[i:i + 100]
 
 
-class TestParseDateText:
-    def test_full_date(self):
-        assert _parse_date_text("3 Feb 2026") == date(2026, 2, 3)
+@pytest.mark.parametrize("raw,expected", [
+    ("26", 26.0),
+    ("19.3", 19.3),
+    ("  14  ", 14.0),
+    ("–", None),
+    ("", None),
+    ("N/A", None),
+    ("26%", 26.0),
+])
+def test_parse_percentage(raw, expected):
+    assert _parse_percentage(raw) == expected
 
-    def test_date_without_year(self):
-        result = _parse_date_text("3 Feb", 2026)
-        assert result == date(2026, 2, 3)
 
-    def test_full_month_name(self):
-        assert _parse_date_text("15 January 2026") == date(2026, 1, 15)
+@pytest.mark.parametrize("raw,expected", [
+    ("2089", 2089),
+    ("2,089", 2089),
+    ("2 089", 2089),
+    ("", None),
+    ("12", None),
+])
+def test_parse_sample_size(raw, expected):
+    assert _parse_sample_size(raw) == expected
 
-    def test_empty(self):
-        assert _parse_date_text("") is None
 
+@pytest.mark.parametrize("raw,year,expected", [
+    ("3 Feb 2026", None, date(2026, 2, 3)),
+    ("3 Feb", 2026, date(2026, 2, 3)),
+    ("15 January 2026", None, date(2026, 1, 15)),
+    ("", None, None),
+])
+def test_parse_date_text(raw, year, expected):
+    assert _parse_date_text(raw, year) == expected
 
-class TestParseFieldworkDates:
-    def test_range_same_month(self):
-        start, end = _parse_fieldwork_dates("1-3 Feb 2026")
-        assert end == date(2026, 2, 3)
-        assert start == date(2026, 2, 1)
 
-    def test_range_cross_month(self):
-        start, end = _parse_fieldwork_dates("28 Jan – 1 Feb 2026")
-        assert end == date(2026, 2, 1)
-        assert start == date(2026, 1, 28)
+@pytest.mark.parametrize("raw,expected", [
+    ("1-3 Feb 2026", (date(2026, 2, 1), date(2026, 2, 3))),
+    ("28 Jan – 1 Feb 2026", (date(2026, 1, 28), date(2026, 2, 1))),
+    ("4 Feb 2026", (date(2026, 2, 4), date(2026, 2, 4))),
+    ("", (None, None)),
+])
+def test_parse_fieldwork_dates(raw, expected):
+    assert _parse_fieldwork_dates(raw) == expected
 
-    def test_single_date(self):
-        start, end = _parse_fieldwork_dates("4 Feb 2026")
-        assert start == date(2026, 2, 4)
-        assert end == date(2026, 2, 4)
 
-    def test_empty(self):
-        start, end = _parse_fieldwork_dates("")
-        assert start is None
-        assert end is None
+@pytest.mark.parametrize("content_type,expected", [
+    ("text/html; charset=UTF-8", "UTF-8"),
+    ('text/html; Charset="iso-8859-1"', "iso-8859-1"),
+    ("text/html", None),
+    ("text/html; charset=bogus", None),
+    (None, None),
+])
+def test_header_charset(content_type, expected):
+    assert _header_charset(content_type) == expected
 
 
 class TestIdentifyColumns:
@@ -116,3 +143,132 @@ class TestIdentifyColumns:
         assert col_map[2] == "sample_size"
         assert col_map[3] == "con"
         assert col_map[4] == "lab"
+
+
+class TestExpandRowspans:
+    def test_rowspan_and_colspan(self):
+        table = lxml.html.fragment_fromstring(
+            "<table>"
+            "<tr><th rowspan='2'>A</th><th colspan='2'>B</th></tr>"
+            "<tr><td>x <!-- note --><b> y</b></td><td>z</td></tr>"
+            "</table>"
+        )
+        assert _expand_rowspans(table) == [
+            ["A", "B", "B"],
+            ["A", "xy", "z"],
+        ]
+
+    def test_style_and_script_text_skipped(self):
+        table = lxml.html.fragment_fromstring(
+            "<table><tr>"
+            "<td><style>.x{font-size:90%}</style>t</td>"
+            "<td>u<script>var v;</script>w</td>"
+            "</tr></table>"
+        )
+        assert _expand_rowspans(table) == [["t", "uw"]]
+
+    def test_spans_clipped_to_grid(self):
+        table = lxml.html.fragment_fromstring(
+            "<table>"
+            "<tr><td>a</td><td rowspan='5' colspan='3'>b</td></tr>"
+            "<tr><td>c</td></tr>"
+            "</table>"
+        )
+        assert _expand_rowspans(table) == [
+            ["a", "b", "b", "b"],
+            ["c", "b", "b", "b"],
+        ]
+
+    def test_empty_table(self):
+        table = lxml.html.fragment_fromstring("<table></table>")
+        assert _expand_rowspans(table) == []
+
+
+class TestScrapePolls:
+    @pytest.fixture
+    def fake_get(self, monkeypatch):
+        calls = []
+
+        def _get(url, headers, **kwargs):
+            assert kwargs["stream"] is True
+            calls.append(headers)
+            if headers.get("If-None-Match") == '"v1"':
+                return _FakeResponse(b"", status_code=304)
+            return _FakeResponse(
+                POLLING_PAGE,
+                headers={
+                    "etag": '"v1"',
+                    "last-modified": "Wed, 04 Feb 2026 12:00:00 GMT",
+                },
+            )
+
+        monkeypatch.setattr(scraper.requests, "get", _get)
+        monkeypatch.setattr(scraper, "_validators", {})
+        return calls
+
+    def test_parses_polling_table(self, fake_get):
+        polls = scrape_polls("https://example.org/polls")
+        assert [p.pollster for p in polls] == [
+            "YouGov", "Find Out Now", "Find Out Now", "YouGov",
+        ]
+        first = polls[0]
+        assert first.fieldwork_start == date(2026, 2, 3)
+        assert first.fieldwork_end == date(2026, 2, 4)
+        assert first.sample_size == 2089
+        assert first.reform == 26.0
+        assert first.lead_party == "Reform UK"
+        assert first.lead_pct == 7.0
+        assert polls[2].fieldwork_start == date(2026, 1, 28)
+        assert polls[2].source_url == "https://example.org/polls"
+
+    @pytest.fixture
+    def serve(self, monkeypatch):
+        """Serve the given page body and headers for every request."""
+        def _serve(content, headers=None):
+            monkeypatch.setattr(
+                scraper.requests, "get",
+                lambda url, **kwargs: _FakeResponse(content, headers=headers),
+            )
+
+        monkeypatch.setattr(scraper, "_validators", {})
+        return _serve
+
+    def test_template_styles_ignored(self, serve):
+        # The CSS would otherwise map this header to sample_size
+        serve(POLLING_PAGE.replace(
+            b"<th>Con</th>",
+            b"<th><style>.mw-parser-output .x{font-size:90%}</style>"
+            b"Con</th>",
+        ))
+        polls = scrape_polls("https://example.org/polls")
+        assert polls[0].con == 18.0
+        assert polls[0].sample_size == 2089
+
+    def test_header_charset_used_for_raw_bytes(self, serve):
+        serve(
+            POLLING_PAGE.replace(b"&#8211;", "\u2013".encode()),
+            headers={"content-type": "text/html; charset=UTF-8"},
+        )
+        polls = scrape_polls("https://example.org/polls")
+        assert polls[0].fieldwork_start == date(2026, 2, 3)
+        assert polls[2].fieldwork_start == date(2026, 1, 28)
+
+    def test_unvalidated_polls_match_validated_models(self, fake_get):
+        polls = scrape_polls("https://example.org/polls")
+        assert polls == [
+            PollResult.model_validate(p.model_dump()) for p in polls
+        ]
+
+    def test_repeated_names_share_one_string(self, fake_get):
+        polls = scrape_polls("https://example.org/polls")
+        assert polls[0].pollster is polls[3].pollster
+        assert polls[0].client is polls[3].client
+
+    def test_unchanged_page_returns_none(self, fake_get):
+        assert scrape_polls("https://example.org/polls")
+        assert scrape_polls("https://example.org/polls") is None
+        assert "If-None-Match" not in fake_get[0]
+        assert fake_get[1]["If-None-Match"] == '"v1"'
+        assert fake_get[1]["If-Modified-Since"] == (
+            "Wed, 04 Feb 2026 12:00:00 GMT"
+        )
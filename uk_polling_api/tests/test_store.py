@@ -2,116 +2,199 @@
 
 from datetime import date
 
-from uk_polling_api.models import PollResult
+import pytest
+
+from uk_polling_api.seed_data import SEED_POLLS
 from uk_polling_api.store import PollingStore
 
 
-def _make_poll(**overrides) -> PollResult:
-    defaults = dict(
-        pollster="TestPoll",
-        client="TestClient",
-        fieldwork_start=date(2026, 1, 1),
-        fieldwork_end=date(2026, 1, 2),
-        sample_size=1000,
-        con=20,
-        lab=22,
-        lib_dem=11,
-        reform=28,
-        green=12,
-        snp=3,
-        other=4,
-        lead_party="Reform UK",
-        lead_pct=6.0,
-    )
-    defaults.update(overrides)
-    return PollResult(**defaults)
+@pytest.fixture(scope="class")
+def polls(make_poll):
+    return [
+        make_poll(
+            pollster="YouGov",
+            fieldwork_end=date(2026, 2, 4),
+            reform=26,
+            lab=19,
+        ),
+        make_poll(
+            pollster="Opinium",
+            fieldwork_end=date(2026, 1, 24),
+            reform=27,
+            lab=22,
+        ),
+        make_poll(
+            pollster="YouGov",
+            fieldwork_end=date(2026, 1, 15),
+            reform=26,
+            lab=21,
+        ),
+    ]
+
+
+@pytest.fixture(scope="class")
+def store(polls):
+    """Store shared across a test class; tests that reload use fresh_store."""
+    store = PollingStore()
+    store.load(polls, source="test")
+    return store
+
+
+@pytest.fixture
+def fresh_store(polls):
+    store = PollingStore()
+    store.load(polls, source="test")
+    return store
 
 
 class TestPollingStore:
-    def setup_method(self):
-        self.store = PollingStore()
-        self.polls = [
-            _make_poll(
-                pollster="YouGov",
-                fieldwork_end=date(2026, 2, 4),
-                reform=26,
-                lab=19,
-            ),
-            _make_poll(
-                pollster="Opinium",
-                fieldwork_end=date(2026, 1, 24),
-                reform=27,
-                lab=22,
-            ),
-            _make_poll(
-                pollster="YouGov",
-                fieldwork_end=date(2026, 1, 15),
-                reform=26,
-                lab=21,
-            ),
-        ]
-        self.store.load(self.polls, source="test")
-
-    def test_load_returns_count(self):
-        count = self.store.load(self.polls, source="test")
+    def test_load_returns_count(self, fresh_store, polls):
+        count = fresh_store.load(polls, source="test")
         assert count == 3
 
-    def test_get_all(self):
-        assert len(self.store.get_all()) == 3
-
-    def test_get_latest(self):
-        latest = self.store.get_latest(2)
-        assert len(latest) == 2
-        assert latest[0].fieldwork_end >= latest[1].fieldwork_end
-
-    def test_get_by_pollster(self):
-        results = self.store.get_by_pollster("yougov")
-        assert len(results) == 2
-
-    def test_get_by_pollster_partial(self):
-        results = self.store.get_by_pollster("opin")
-        assert len(results) == 1
-        assert results[0].pollster == "Opinium"
-
-    def test_get_by_party(self):
-        results = self.store.get_by_party("reform")
-        assert len(results) == 3
-        assert all("value" in r for r in results)
-
-    def test_get_by_party_display_name(self):
-        results = self.store.get_by_party("Reform UK")
-        assert len(results) == 3
-
-    def test_get_by_party_invalid(self):
-        results = self.store.get_by_party("pirate")
-        assert results == []
-
-    def test_get_date_range(self):
-        results = self.store.get_date_range(
-            date(2026, 1, 20), date(2026, 2, 28)
+    @pytest.mark.parametrize("call,check", [
+        pytest.param(
+            lambda s: s.get_all(),
+            lambda r: len(r) == 3,
+            id="get_all",
+        ),
+        pytest.param(
+            lambda s: s.get_latest(2),
+            lambda r: (
+                len(r) == 2 and r[0].fieldwork_end >= r[1].fieldwork_end
+            ),
+            id="get_latest",
+        ),
+        pytest.param(
+            lambda s: s.get_by_pollster("yougov"),
+            lambda r: len(r) == 2,
+            id="get_by_pollster",
+        ),
+        pytest.param(
+            lambda s: s.get_by_pollster("opin"),
+            lambda r: len(r) == 1 and r[0].pollster == "Opinium",
+            id="get_by_pollster_partial",
+        ),
+        pytest.param(
+            lambda s: s.get_by_party("reform"),
+            lambda r: len(r) == 3 and all("value" in x for x in r),
+            id="get_by_party",
+        ),
+        pytest.param(
+            lambda s: s.get_by_party("Reform UK"),
+            lambda r: len(r) == 3,
+            id="get_by_party_display_name",
+        ),
+        pytest.param(
+            lambda s: s.get_by_party("pirate"),
+            lambda r: r == [],
+            id="get_by_party_invalid",
+        ),
+        pytest.param(
+            lambda s: s.get_date_range(date(2026, 1, 20), date(2026, 2, 28)),
+            lambda r: len(r) == 2,
+            id="get_date_range",
+        ),
+        pytest.param(
+            lambda s: s.get_date_range(date(2026, 1, 15), date(2026, 1, 24)),
+            lambda r: [p.pollster for p in r] == ["Opinium", "YouGov"],
+            id="get_date_range_inclusive_bounds",
+        ),
+    ])
+    def test_store_reads(self, store, call, check):
+        assert check(call(store))
+
+    def test_get_date_range_skips_undated_polls(
+        self, fresh_store, polls, make_poll,
+    ):
+        fresh_store.load(
+            polls + [make_poll(fieldwork_end=None)], source="test"
         )
-        assert len(results) == 2
+        results = fresh_store.get_date_range(date.min, date.max)
+        assert len(results) == 3
 
-    def test_get_summary(self):
-        summary = self.store.get_summary(3)
+    def test_get_summary(self, store):
+        summary = store.get_summary(3)
         assert summary is not None
         assert summary.poll_count == 3
         assert summary.leader == "Reform UK"
         assert summary.lead_margin > 0
         assert summary.averages["Reform UK"] is not None
 
-    def test_get_trends(self):
-        trends = self.store.get_trends()
+    def test_get_summary_rounds_exact_mean(self, make_poll):
+        # A running float sum of these lands just above 27.45 and rounds
+        # up; the exact mean rounds to 27.4
+        reform = [20.3, 17.1, 33.3, 39.1]
+        store = PollingStore()
+        store.load([
+            make_poll(fieldwork_end=date(2026, 1, 10 - i), reform=value)
+            for i, value in enumerate(reform)
+        ], source="test")
+        assert store.get_summary(4).averages["Reform UK"] == 27.4
+
+    def test_get_trends(self, store):
+        trends = store.get_trends()
         party_names = {t.party for t in trends}
         assert "Reform UK" in party_names
         assert "Labour" in party_names
 
-    def test_get_status(self):
-        status = self.store.get_status()
+    def test_get_trends_data_points(self, store):
+        reform = next(
+            t for t in store.get_trends() if t.party == "Reform UK"
+        )
+        assert reform.data_points == [
+            {"date": "2026-02-04", "value": 26},
+            {"date": "2026-01-24", "value": 27},
+            {"date": "2026-01-15", "value": 26},
+        ]
+
+    def test_get_status(self, store):
+        status = store.get_status()
         assert status.total_polls == 3
         assert status.latest_poll_date == date(2026, 2, 4)
+        assert status.oldest_poll_date == date(2026, 1, 15)
         assert status.source == "test"
         assert status.last_refreshed is not None
+        assert status.last_refreshed.tzinfo is not None
+
+    def test_cached_getters_reuse_results(self, store):
+        summary = store.cached_get_summary(3)
+        assert store.cached_get_summary(3) is summary
+        assert (
+            store.cached_get_by_pollster(" YouGov ")
+            is store.cached_get_by_pollster("yougov")
+        )
+
+    def test_get_by_pollster_exact_name_keeps_partial_matches(
+        self, fresh_store, polls, make_poll,
+    ):
+        fresh_store.load(
+            polls + [make_poll(pollster="YouGov MRP")], source="test"
+        )
+        assert len(fresh_store.get_by_pollster("yougov")) == 3
+        assert len(fresh_store.get_by_pollster("yougov mrp")) == 1
+
+    def test_party_aliases_share_points(self, fresh_store, polls):
+        points = fresh_store.get_by_party("reform")
+        assert fresh_store.get_by_party("Reform UK") is points
+        fresh_store.load(polls, source="test")
+        assert fresh_store.get_by_party("reform") is not points
+
+    def test_load_bumps_version(self, fresh_store, polls):
+        version = fresh_store.version
+        fresh_store.load(polls, source="test")
+        assert fresh_store.version == version + 1
+
+    def test_load_invalidates_cached_getters(self, fresh_store, polls):
+        before = fresh_store.cached_get_latest(10)
+        fresh_store.load(polls[:1], source="test")
+        after = fresh_store.cached_get_latest(10)
+        assert len(before) == 3
+        assert len(after) == 1
+
+    def test_seed_data(self, seeded_store):
+        assert seeded_store.poll_count == len(SEED_POLLS)
+        assert seeded_store.get_summary() is not None
 
     def test_empty_store(self):
         empty = PollingStore()